@@ -19,7 +19,9 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         entity = HomeSeerBinarySensor(device, bridge)
         binary_sensor_entities.append(entity)
         _LOGGER.info(
-            f"Added HomeSeer binary-sensor-type device: {entity.name} ({entity.device_state_attributes})"
+            "Added HomeSeer binary-sensor-type device: %s (%s)",
+            entity.name,
+            entity.device_state_attributes,
         )
 
     if binary_sensor_entities:
@@ -1,6 +1,7 @@
 """Support for HomeSeer light-type devices."""
 
 import logging
+from typing import Optional
 
 from homeassistant.components.climate import ClimateEntity
 from homeassistant.components.climate.const import (
@@ -28,6 +29,7 @@ from .libhomeseer.devices import (
     CONTROL_USE_THERM_MODE_OFF,
     CONTROL_USE_THERM_MODE_HEAT,
     CONTROL_USE_THERM_MODE_COOL,
+    get_control_value_by_control_use,
 )
 
 from .const import DOMAIN
@@ -36,117 +38,170 @@ from .homeseer import HomeSeerEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+_HVAC_MODES = (HVAC_MODE_OFF, HVAC_MODE_HEAT, HVAC_MODE_COOL)
+# Ordered by precedence when several modes share a control value: heat, then cool, then off.
+_THERM_MODE_CONTROL_USES = (
+    CONTROL_USE_THERM_MODE_HEAT,
+    CONTROL_USE_THERM_MODE_COOL,
+    CONTROL_USE_THERM_MODE_OFF,
+)
+_MODE_MAP = {
+    HVAC_MODE_HEAT: CONTROL_USE_THERM_MODE_HEAT,
+    HVAC_MODE_COOL: CONTROL_USE_THERM_MODE_COOL,
+    HVAC_MODE_OFF: CONTROL_USE_THERM_MODE_OFF,
+}
+_HVAC_MODE_BY_CONTROL_USE = {v: k for k, v in _MODE_MAP.items()}
+
+
+class SubDeviceValue:
+    """Read-only entity attribute returning a field of an optional sub-device, or a default if it is missing."""
+
+    __slots__ = ("_attr", "_field", "_default")
+
+    def __init__(self, attr: str, field: str = "value", default=0) -> None:
+        self._attr = attr
+        self._field = field
+        self._default = default
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        sub_device = getattr(obj, self._attr)
+        if sub_device is None:
+            return self._default
+        return getattr(sub_device, self._field)
+
+    def __set__(self, obj, value) -> None:
+        raise AttributeError("can't set attribute")
+
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up HomeSeer thermostat-type devices."""
-    climate_entites = []
     bridge = hass.data[DOMAIN]
 
     _LOGGER.info("Adding HomeSeer Climate sensor")
-    for device in bridge.devices["climate"]:
-        entity = HomeSeerClimate(device, bridge)
-        climate_entites.append(entity)
+    climate_entities = [
+        HomeSeerClimate(device, bridge) for device in bridge.devices["climate"]
+    ]
+    for entity in climate_entities:
         _LOGGER.info(
-            f"Added HomeSeer thermostat-type device: {entity.name} ({entity.device_state_attributes})"
+            "Added HomeSeer thermostat-type device: %s (%s)",
+            entity.name,
+            entity.device_state_attributes,
         )
 
-    if climate_entites:
-        async_add_entities(climate_entites)
+    if climate_entities:
+        async_add_entities(climate_entities)
 
 
 class HomeSeerClimate(HomeSeerEntity, ClimateEntity):
     """Representation of a HomeSeer light-type device."""
 
-    @property
-    def temperature_unit(self):
-        return TEMP_CELSIUS
-
-    @property
-    def current_temperature(self) -> float:
-        if self._device._temp is not None:
-            return self._device._temp.value
-        return 0
+    temperature_unit = TEMP_CELSIUS
+    target_temperature_step = 0.5
+    hvac_modes = _HVAC_MODES
+    supported_features = SUPPORT_TARGET_TEMPERATURE
+    current_temperature = SubDeviceValue("_temp_dev")
+    target_temperature_high = SubDeviceValue("_heating_sp")
+    target_temperature_low = SubDeviceValue("_cooling_sp")
+
+    def __init__(self, device, bridge):
+        super().__init__(device, bridge)
+        self._temp_dev = device._temp
+        self._mode_dev = device._mode
+        self._heater_dev = device._heater
+        self._heating_sp = device._heating_setpoint
+        self._cooling_sp = device._cooling_setpoint
+        # The mode device's control pairs are fixed, so resolve once which
+        # value corresponds to which thermostat mode control use.
+        self._mode_by_value = {}
+        if self._mode_dev is not None:
+            for control_use in _THERM_MODE_CONTROL_USES:
+                value = get_control_value_by_control_use(
+                    self._mode_dev._control_data, control_use
+                )
+                if value is not None:
+                    self._mode_by_value.setdefault(value, control_use)
+
+    async def async_added_to_hass(self) -> None:
+        """Register update callbacks on the sub-devices this entity renders."""
+        await super().async_added_to_hass()
+        for sub_device in (
+            self._mode_dev,
+            self._temp_dev,
+            self._heater_dev,
+            self._heating_sp,
+            self._cooling_sp,
+        ):
+            if sub_device is not None:
+                sub_device.register_update_callback(
+                    self._async_update_callback, suppress_on_connection=True
+                )
+
+    def _state_fingerprint(self) -> tuple:
+        """Return the values the thermostat state is rendered from."""
+        return (
+            self.available,
+            self._device.last_change,
+            getattr(self._mode_dev, "value", None),
+            getattr(self._heater_dev, "value", None),
+            self.current_temperature,
+            self.target_temperature_high,
+            self.target_temperature_low,
+        )
 
     @property
     def target_temperature(self) -> float:
-        if self.is_cooling:
+        if self._current_mode == CONTROL_USE_THERM_MODE_COOL:
             return self.target_temperature_low
         return self.target_temperature_high
 
     @property
-    def target_temperature_high(self) -> float:
-        if self._device._heating_setpoint is not None:
-            return self._device._heating_setpoint.value
-        return 0
-
-    @property
-    def target_temperature_low(self) -> float:
-        if self._device._cooling_setpoint is not None:
-            return self._device._cooling_setpoint.value
-        return 0
+    def hvac_mode(self):
+        return _HVAC_MODE_BY_CONTROL_USE.get(self._current_mode, HVAC_MODE_OFF)
 
     @property
-    def target_temperature_step(self) -> float:
-        return 0.5
+    def _current_mode(self) -> Optional[int]:
+        """Return the thermostat mode control use matching the mode device's current value."""
+        return self._mode_by_value.get(self._mode_dev.value)
 
-    @property
-    def hvac_mode(self):
-        if self.is_heating:
-            _LOGGER.info(f"Thermostat mode is heating.")
-            return HVAC_MODE_HEAT
-        if self.is_cooling:
-            _LOGGER.info(f"Thermostat mode is cool.")
-            return HVAC_MODE_COOL
-        _LOGGER.info(f"Thermostat mode is off.")
-        return HVAC_MODE_OFF
-    
     @property
     def is_heating(self) -> bool:
-        return self._device._mode.is_value(CONTROL_USE_THERM_MODE_HEAT)
+        return self._current_mode == CONTROL_USE_THERM_MODE_HEAT
 
     @property
     def is_cooling(self) -> bool:
-        return self._device._mode.is_value(CONTROL_USE_THERM_MODE_COOL)
+        return self._current_mode == CONTROL_USE_THERM_MODE_COOL
 
     @property
     def is_off(self) -> bool:
-        return self._device._mode.is_value(CONTROL_USE_THERM_MODE_OFF)
+        return self._current_mode == CONTROL_USE_THERM_MODE_OFF
 
     @property
     def hvac_action(self):
-        _LOGGER.info(f"Thermostat heater: {self._device._heater.value}")
-        if self._device._heater.is_on:
+        heater = self._heater_dev
+        _LOGGER.debug("Thermostat heater: %s", heater.value)
+        if heater.is_on:
             return CURRENT_HVAC_HEAT
         return CURRENT_HVAC_IDLE
 
-    @property
-    def hvac_modes(self):
-        return [HVAC_MODE_OFF, HVAC_MODE_HEAT, HVAC_MODE_COOL]
-
-    @property
-    def supported_features(self):
-        """Flag supported features."""
-        return SUPPORT_TARGET_TEMPERATURE
-
     async def async_set_hvac_mode(self, hvac_mode):
         """Set new target hvac mode."""
+        _LOGGER.debug("Set %s mode to %s.", self._mode_dev.ref, hvac_mode)
         mode = self.convert_mode(hvac_mode)
-        self._device._mode.set_control_use_value(mode)
+        await self._mode_dev.set_control_use_value(mode)
     
     def convert_mode(self, hvac_mode) -> int:
-        _LOGGER.info(f"Set {self._device._mode.ref} mode to {hvac_mode}.")
-        if hvac_mode == HVAC_MODE_HEAT:
-            return CONTROL_USE_THERM_MODE_HEAT
-        if hvac_mode == HVAC_MODE_COOL:
-            return CONTROL_USE_THERM_MODE_COOL
-        if hvac_mode == HVAC_MODE_OFF:
-            return CONTROL_USE_THERM_MODE_OFF
-        return CONTROL_USE_THERM_MODE_OFF
+        return _MODE_MAP.get(hvac_mode, CONTROL_USE_THERM_MODE_OFF)
 
     async def async_set_temperature(self, **kwargs):
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is None:
             return
-        if self.is_heating:
-            await self._device._heating_setpoint.set_value(temperature)
-        elif self.is_cooling:
-            await self._device._cooling_setpoint.set_value(temperature)
+        mode = self._current_mode
+        if mode == CONTROL_USE_THERM_MODE_HEAT:
+            setpoint = self._heating_sp
+        elif mode == CONTROL_USE_THERM_MODE_COOL:
+            setpoint = self._cooling_sp
+        else:
+            return
+        await setpoint.set_value(temperature)
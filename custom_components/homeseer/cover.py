@@ -15,30 +15,30 @@ from homeassistant.components.cover import (
 
 from .const import DOMAIN
 from .homeseer import HomeSeerEntity
+from .libhomeseer import HomeSeerCoverDevice, HomeSeerDimmableDevice
 
 _LOGGER = logging.getLogger(__name__)
 
+_STATUS_OPENING = "Opening"
+_STATUS_CLOSING = "Closing"
+_STATUS_CLOSED = "Closed"
+
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up HomeSeer cover-type devices."""
-    cover_entities = []
     bridge = hass.data[DOMAIN]
 
-    for device in bridge.devices["cover"]:
-        if hasattr(device, "dim"):
-            """Device is a blind."""
-            entity = HomeSeerBlind(device, bridge)
-            cover_entities.append(entity)
-            _LOGGER.info(
-                f"Added HomeSeer blind-type device: {entity.name} ({entity.device_state_attributes})"
-            )
-        else:
-            """Device is a garage-door opener."""
-            entity = HomeSeerGarageDoor(device, bridge)
-            cover_entities.append(entity)
-            _LOGGER.info(
-                f"Added HomeSeer garage-type device: {entity.name} ({entity.device_state_attributes})"
-            )
+    cover_entities = [
+        _COVER_CLASS_MAP.get(type(device), HomeSeerGarageDoor)(device, bridge)
+        for device in bridge.devices["cover"]
+    ]
+    for entity in cover_entities:
+        _LOGGER.info(
+            "Added HomeSeer %s-type device: %s (%s)",
+            "blind" if isinstance(entity, HomeSeerBlind) else "garage",
+            entity.name,
+            entity.device_state_attributes,
+        )
 
     if cover_entities:
         async_add_entities(cover_entities)
@@ -56,35 +56,30 @@ class HomeSeerCover(HomeSeerEntity, CoverEntity):
 class HomeSeerGarageDoor(HomeSeerCover):
     """Representation of a garage door opener device."""
 
-    @property
-    def supported_features(self):
-        """Return the features supported by the device."""
-        return SUPPORT_OPEN | SUPPORT_CLOSE
-
-    @property
-    def device_class(self):
-        """Return the device class for the device."""
-        return DEVICE_CLASS_GARAGE
+    supported_features = SUPPORT_OPEN | SUPPORT_CLOSE
+    device_class = DEVICE_CLASS_GARAGE
 
     @property
     def is_opening(self):
         """Return if the cover is opening or not."""
-        return self._device.status == "Opening"
+        return self._device.status == _STATUS_OPENING
 
     @property
     def is_closing(self):
         """Return if the cover is closing or not."""
-        return self._device.status == "Closing"
+        return self._device.status == _STATUS_CLOSING
 
     @property
     def is_closed(self):
         """Return if the cover is closed or not."""
-        return self._device.status == "Closed"
+        return self._device.status == _STATUS_CLOSED
 
 
 class HomeSeerBlind(HomeSeerCover):
     """Representation of a window-covering device."""
 
+    device_class = DEVICE_CLASS_BLIND
+
     @property
     def supported_features(self):
         """Return the features supported by the device."""
@@ -93,11 +88,6 @@ class HomeSeerBlind(HomeSeerCover):
         else: 
             return SUPPORT_OPEN | SUPPORT_CLOSE | SUPPORT_STOP
 
-    @property
-    def device_class(self):
-        """Return the device class for the device."""
-        return DEVICE_CLASS_BLIND
-
     @property
     def current_cover_position(self):
         if self._device.dim_supported:
@@ -115,3 +105,10 @@ class HomeSeerBlind(HomeSeerCover):
     
     async def async_stop_cover(self, **kwargs):
         await self._device.stop()
+
+
+# Devices with a dim control are blinds, all others are garage-door openers.
+_COVER_CLASS_MAP = {
+    HomeSeerCoverDevice: HomeSeerBlind,
+    HomeSeerDimmableDevice: HomeSeerBlind,
+}
@@ -1,7 +1,7 @@
 """Provides HomeSeer specific implementations for bridges, entities, and remotes."""
-from custom_components.homeseer.libhomeseer.devices import HomeSeerClimateDevice
 from .libhomeseer import (
     HomeSeer,
+    HomeSeerClimateDevice,
     HomeSeerStatusDevice,
     HomeSeerSwitchableDevice,
     HomeSeerLockableDevice,
@@ -16,7 +16,7 @@ import logging
 from typing import Optional, Union
 
 from homeassistant.const import CONF_EVENT, CONF_ID
-from homeassistant.core import EventOrigin, HomeAssistant
+from homeassistant.core import EventOrigin, HomeAssistant, callback
 from homeassistant.helpers import aiohttp_client, template
 from homeassistant.helpers.entity import Entity
 
@@ -130,8 +130,11 @@ class HomeSeerBridge:
         for device in self.devices["remote"]:
             self.remotes.append(HomeSeerRemote(self._hass, device))
             _LOGGER.info(
-                f"Added HomeSeer remote-type device: "
-                f"{device.location2} {device.location} {device.name } ({device.ref})"
+                "Added HomeSeer remote-type device: %s %s %s (%s)",
+                device.location2,
+                device.location,
+                device.name,
+                device.ref,
             )
 
         return True
@@ -166,16 +169,19 @@ class HomeSeerBridge:
         )
         if iname not in self.allowed_interfaces:
             _LOGGER.debug(
-                f"Device ref {device.ref} is from disabled interface {iname}, "
-                f"not creating an entity for this device"
+                "Device ref %s is from disabled interface %s, "
+                "not creating an entity for this device",
+                device.ref,
+                iname,
             )
             return None
 
         # Force certain devices selected during the Config Flow to be covers.
         if device.ref in self.forced_covers:
             _LOGGER.debug(
-                f"Device ref {device.ref} is forced as a cover, "
-                f"creating a cover entity for this device"
+                "Device ref %s is forced as a cover, "
+                "creating a cover entity for this device",
+                device.ref,
             )
             return "cover"
 
@@ -186,9 +192,10 @@ class HomeSeerBridge:
             return HOMESEER_QUIRKS[device.device_type_string]
         except KeyError:
             _LOGGER.debug(
-                f"No platform quirk found for device type string "
-                f"{device.device_type_string}, "
-                f"automatically assigning a platform for device ref {device.ref}"
+                "No platform quirk found for device type string %s, "
+                "automatically assigning a platform for device ref %s",
+                device.device_type_string,
+                device.ref,
             )
 
         # Return the platform for the device based on the libhomeseer device type
@@ -208,7 +215,9 @@ class HomeSeerBridge:
             return "sensor"
 
         _LOGGER.warning(
-            f"No valid platform detected for device ref {device.ref} (type: {type(device)})"
+            "No valid platform detected for device ref %s (type: %s)",
+            device.ref,
+            type(device),
         )
         return None
 
@@ -231,6 +240,7 @@ class HomeSeerEntity(Entity):
     ):
         self._device = device
         self._bridge = bridge
+        self._last_fingerprint = None
 
     @property
     def available(self) -> bool:
@@ -289,7 +299,23 @@ class HomeSeerEntity(Entity):
 
     async def async_added_to_hass(self) -> None:
         """Register update callback."""
-        self._device.register_update_callback(self.async_schedule_update_ha_state)
+        self._device.register_update_callback(self._async_update_callback)
+
+    def _state_fingerprint(self) -> Optional[tuple]:
+        """
+        Return a tuple of the values the entity state is rendered from,
+        or None to write the state on every device update.
+        """
+        return None
+
+    @callback
+    def _async_update_callback(self) -> None:
+        """Schedule a state write unless the device update left the entity state unchanged."""
+        fingerprint = self._state_fingerprint()
+        if fingerprint is not None and fingerprint == self._last_fingerprint:
+            return
+        self._last_fingerprint = fingerprint
+        self.async_schedule_update_ha_state()
 
 
 class HomeSeerRemote:
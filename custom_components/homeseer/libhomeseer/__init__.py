@@ -1,4 +1,29 @@
-from .const import *
+from .const import (
+    DEFAULT_ASCII_PORT,
+    DEFAULT_HTTP_PORT,
+    DEFAULT_PASSWORD,
+    DEFAULT_USERNAME,
+    DEVICE_ZWAVE_BARRIER_OPERATOR,
+    DEVICE_ZWAVE_BATTERY,
+    DEVICE_ZWAVE_CENTRAL_SCENE,
+    DEVICE_ZWAVE_DOOR_LOCK,
+    DEVICE_ZWAVE_DOOR_LOCK_LOGGING,
+    DEVICE_ZWAVE_ELECTRIC_METER,
+    DEVICE_ZWAVE_FAN_STATE,
+    DEVICE_ZWAVE_LUMINANCE,
+    DEVICE_ZWAVE_OPERATING_STATE,
+    DEVICE_ZWAVE_RELATIVE_HUMIDITY,
+    DEVICE_ZWAVE_SENSOR_BINARY,
+    DEVICE_ZWAVE_SENSOR_MULTILEVEL,
+    DEVICE_ZWAVE_SWITCH,
+    DEVICE_ZWAVE_SWITCH_BINARY,
+    DEVICE_ZWAVE_SWITCH_MULTILEVEL,
+    DEVICE_ZWAVE_TEMPERATURE,
+    DEVICE_ZWAVE_WATTS,
+    RELATIONSHIP_ROOT,
+    RELATIONSHIP_STANDALONE,
+    RELATIONSHIP_CHILD,
+)
 from .devices import (
     HomeSeerStatusDevice,
     HomeSeerSwitchableDevice,
@@ -6,7 +31,25 @@ from .devices import (
     HomeSeerLockableDevice,
     HomeSeerCoverDevice,
     HomeSeerFanDevice,
-    HomeSeerSetPointDevice
+    HomeSeerSetPointDevice,
+    HomeSeerClimateDevice,
+    set_many,
+)
+from .helpers import (
+    HS_UNIT_A,
+    HS_UNIT_AMPERES,
+    HS_UNIT_CELSIUS,
+    HS_UNIT_FAHRENHEIT,
+    HS_UNIT_KW,
+    HS_UNIT_KWH,
+    HS_UNIT_LUX,
+    HS_UNIT_PERCENTAGE,
+    HS_UNIT_V,
+    HS_UNIT_VOLTS,
+    HS_UNIT_W,
+    HS_UNIT_WATTS,
+    HS_NULL_DATE,
+    get_datetime_from_last_change,
+    get_uom_from_status,
 )
-from .helpers import *
 from .homeseer import HomeSeer
@@ -1,5 +1,32 @@
 """Constants used in libhomeseer."""
 
+__all__ = [
+    "DEFAULT_ASCII_PORT",
+    "DEFAULT_HTTP_PORT",
+    "DEFAULT_PASSWORD",
+    "DEFAULT_USERNAME",
+    "DEVICE_ZWAVE_BARRIER_OPERATOR",
+    "DEVICE_ZWAVE_BATTERY",
+    "DEVICE_ZWAVE_CENTRAL_SCENE",
+    "DEVICE_ZWAVE_DOOR_LOCK",
+    "DEVICE_ZWAVE_DOOR_LOCK_LOGGING",
+    "DEVICE_ZWAVE_ELECTRIC_METER",
+    "DEVICE_ZWAVE_FAN_STATE",
+    "DEVICE_ZWAVE_LUMINANCE",
+    "DEVICE_ZWAVE_OPERATING_STATE",
+    "DEVICE_ZWAVE_RELATIVE_HUMIDITY",
+    "DEVICE_ZWAVE_SENSOR_BINARY",
+    "DEVICE_ZWAVE_SENSOR_MULTILEVEL",
+    "DEVICE_ZWAVE_SWITCH",
+    "DEVICE_ZWAVE_SWITCH_BINARY",
+    "DEVICE_ZWAVE_SWITCH_MULTILEVEL",
+    "DEVICE_ZWAVE_TEMPERATURE",
+    "DEVICE_ZWAVE_WATTS",
+    "RELATIONSHIP_ROOT",
+    "RELATIONSHIP_STANDALONE",
+    "RELATIONSHIP_CHILD",
+]
+
 DEFAULT_ASCII_PORT = 11000
 DEFAULT_HTTP_PORT = 80
 DEFAULT_PASSWORD = "default"
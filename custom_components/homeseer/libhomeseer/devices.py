@@ -1,10 +1,10 @@
 """Representations of API data for HomeSeer devices as Python objects."""
 
-import logging
-from sys import modules
-from typing import Callable, List, Optional, Tuple, Union
+from __future__ import annotations
 
-from .const import RELATIONSHIP_CHILD, RELATIONSHIP_ROOT, RELATIONSHIP_STANDALONE
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 CONTROL_USE_NONE = 0 # sometimes used as 'energy save heat'
 CONTROL_USE_ON = 1
@@ -33,6 +33,28 @@ SUPPORT_STOP = 64
 SUPPORT_SETPOINT = 128
 SUPPORT_THERM_MODES = 512
 
+_MASK_SWITCH = SUPPORT_ON | SUPPORT_OFF
+_MASK_DIM = _MASK_SWITCH | SUPPORT_DIM
+_MASK_COVER = _MASK_DIM | SUPPORT_STOP
+_MASK_COVER_NODIM = _MASK_SWITCH | SUPPORT_STOP
+_MASK_FAN = _MASK_SWITCH | SUPPORT_FAN
+_MASK_LOCK = SUPPORT_LOCK | SUPPORT_UNLOCK
+
+_CONTROL_USE_TO_SUPPORT = {
+    CONTROL_USE_ON: SUPPORT_ON,
+    CONTROL_USE_OFF: SUPPORT_OFF,
+    CONTROL_USE_STOP: SUPPORT_STOP,
+    CONTROL_USE_LOCK: SUPPORT_LOCK,
+    CONTROL_USE_UNLOCK: SUPPORT_UNLOCK,
+    CONTROL_USE_DIM: SUPPORT_DIM,
+    CONTROL_USE_FAN: SUPPORT_FAN,
+    CONTROL_USE_COOL_SETPOINT: SUPPORT_SETPOINT,
+    CONTROL_USE_HEAT_SETPOINT: SUPPORT_SETPOINT,
+    CONTROL_USE_THERM_MODE_COOL: SUPPORT_THERM_MODES,
+    CONTROL_USE_THERM_MODE_HEAT: SUPPORT_THERM_MODES,
+    CONTROL_USE_THERM_MODE_OFF: SUPPORT_THERM_MODES,
+}
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -42,22 +64,49 @@ class HomeSeerStatusDevice:
     Base representation for all other HomeSeer device objects.
     """
 
+    __slots__ = (
+        "_raw_data",
+        "_control_data",
+        "_request",
+        "_update_callback",
+        "_suppress_update_callback",
+        "_ref",
+        "_name",
+        "_value",
+        "_relationship",
+    )
+
     def __init__(self, raw_data: dict, control_data: dict, request: Callable) -> None:
         self._raw_data = raw_data
         self._control_data = control_data
         self._request = request
         self._update_callback = None
         self._suppress_update_callback = False
+        self._reparse()
+
+    def _reparse(self) -> None:
+        """Parse and cache the frequently read fields of the raw device data."""
+        raw_data = self._raw_data
+        self._ref = int(raw_data["ref"])
+        self._name = raw_data["name"]
+        value = raw_data["value"]
+        if isinstance(value, (int, float)):
+            self._value = value
+        elif isinstance(value, str) and "." in value:
+            self._value = float(value)
+        else:
+            self._value = int(value)
+        self._relationship = int(raw_data["relationship"])
 
     @property
     def ref(self) -> int:
         """Return the HomeSeer device ref of the device."""
-        return int(self._raw_data["ref"])
+        return self._ref
 
     @property
     def name(self) -> str:
         """Return the name of the device."""
-        return self._raw_data["name"]
+        return self._name
 
     @property
     def location(self) -> str:
@@ -72,9 +121,7 @@ class HomeSeerStatusDevice:
     @property
     def value(self) -> Union[int, float]:
         """Return the value of the device."""
-        if "." in str(self._raw_data["value"]):
-            return float(self._raw_data["value"])
-        return int(self._raw_data["value"])
+        return self._value
 
     @property
     def status(self) -> str:
@@ -101,14 +148,7 @@ class HomeSeerStatusDevice:
         3 = Standalone (this is the only device that represents this physical device)
         4 = Child (this device is part of a group of devices that represent the physical device)
         """
-        relationship = int(self._raw_data["relationship"])
-        if relationship == RELATIONSHIP_ROOT:
-            return RELATIONSHIP_ROOT
-        elif relationship == RELATIONSHIP_CHILD:
-            return RELATIONSHIP_CHILD
-        elif relationship == RELATIONSHIP_STANDALONE:
-            return RELATIONSHIP_STANDALONE
-        return relationship
+        return self._relationship
 
     @property
     def associated_devices(self) -> list:
@@ -142,10 +182,16 @@ class HomeSeerStatusDevice:
     def update_data(self, new_data: dict = None, connection_flag: bool = False) -> None:
         """Retrieve and cache updated data for the device from the HomeSeer JSON API."""
         if new_data is not None:
-            _LOGGER.debug(
-                f"Updating data for {self.location2} {self.location} {self.name} ({self.ref})"
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Updating data for %s %s %s (%s)",
+                    self.location2,
+                    self.location,
+                    self.name,
+                    self.ref,
+                )
             self._raw_data = new_data
+            self._reparse()
 
         if connection_flag and self._suppress_update_callback:
             return
@@ -159,7 +205,7 @@ class HomeSeerStatusDevice:
 
     async def set_value(self, value) -> None:
         params = self.get_params(value)
-        _LOGGER.info(f"Set device {self.ref} value to {value}.")
+        _LOGGER.info("Set device %s value to %s.", self.ref, value)
         await self._request("get", params=params)
 
     def is_value(self, control_use):
@@ -176,11 +222,13 @@ class HomeSeerStatusDevice:
         mode_value = get_control_value_by_control_use(self._control_data, control_use)
         if mode_value is None or mode_value == self.value:
             return
-        self.set_value(mode_value)
+        await self.set_value(mode_value)
 
 class HomeSeerSetPointDevice(HomeSeerStatusDevice):
     """Representation of a HomeSeer device that has a set point control pairs."""
 
+    __slots__ = ("_set_min", "_set_max")
+
     def __init__(
         self, raw_data: dict, control_data: dict, request: Callable, set_min:float,set_max:float
     ) -> None:
@@ -189,14 +237,22 @@ class HomeSeerSetPointDevice(HomeSeerStatusDevice):
         self._set_max = set_max
 
     async def set_setpoint(self, value: float) -> None:
-        if self._set_min <= value and value <= self._set_max:
+        if self._set_min <= value <= self._set_max:
             await self.set_value(value)
         else:
-            _LOGGER.warning(f"Trying to set {self.ref} to {value} while range is {self._set_min} to {self._set_max}.")
+            _LOGGER.warning(
+                "Trying to set %s to %s while range is %s to %s.",
+                self.ref,
+                value,
+                self._set_min,
+                self._set_max,
+            )
 
 class HomeSeerSwitchableDevice(HomeSeerStatusDevice):
     """Representation of a HomeSeer device that has On and Off control pairs."""
 
+    __slots__ = ("_on_value", "_off_value")
+
     def __init__(
         self, raw_data: dict, control_data: dict, request: Callable, on_value: int, off_value: int
     ) -> None:
@@ -220,12 +276,17 @@ class HomeSeerSwitchableDevice(HomeSeerStatusDevice):
 class HomeSeerDimmableDevice(HomeSeerSwitchableDevice):
     """Representation of a HomeSeer device that has a Dim control pair."""
 
+    __slots__ = ("_dim_start_value", "_dim_end_value", "_dim_range", "_dim_scale")
+
     def __init__(
         self, raw_data: dict, control_data: dict, request: Callable, on_value: int, off_value: int, dim_start_value:int, dim_end_value:int
     ) -> None:
         super().__init__(raw_data, control_data, request, on_value, off_value)
         self._dim_start_value = dim_start_value
         self._dim_end_value = dim_end_value
+        # The dim range is fixed, so precompute it and the percent -> value scale factor.
+        self._dim_range = dim_end_value - dim_start_value
+        self._dim_scale = self._dim_range / 100
 
     @property
     def dim_supported(self) -> bool:
@@ -233,35 +294,37 @@ class HomeSeerDimmableDevice(HomeSeerSwitchableDevice):
 
     @property
     def dim_range(self) -> int:
-        return self._dim_end_value - self._dim_start_value
+        return self._dim_range
 
     @property
     def dim_percent(self) -> int:
-        """Returns a number from 0 to 1 representing the current dim percentage."""
-        if self.value == self._on_value:
+        """Returns a number from 0 to 100 representing the current dim percentage."""
+        value = self.value
+        if value == self._on_value:
             return 100
-        if self.value == self._off_value:
+        if value == self._off_value:
             return 0
         if not self.dim_supported:
             return 0
-        
-        return 100 * (self.value - self._dim_start_value) / self.dim_range
+
+        return 100 * (value - self._dim_start_value) / self._dim_range
 
     async def dim(self, percent: int) -> None:
+        """Dim the device on a scale from 0 to 100."""
         if not self.dim_supported:
             return
 
-        """Dim the device on a scale from 0 to 100."""
-        if percent < 0 or percent > 100:
+        if not 0 <= percent <= 100:
             raise ValueError("Percent must be an integer from 0 to 100")
 
-        step = (self.dim_range) / 100
-        value = int(step * percent) + self._dim_start_value
+        value = int(self._dim_scale * percent) + self._dim_start_value
         await self.set_value(value)
 
 class HomeSeerCoverDevice(HomeSeerDimmableDevice):
     """Representation of a HomeSeer cover that has a Stop and/or Dim control pair."""
 
+    __slots__ = ("_stop_value",)
+
     def __init__(
         self, raw_data: dict, control_data: dict, request: Callable, on_value: int, off_value: int, stop_value: int, dim_start_value:int = 0, dim_end_value:int = 0
     ) -> None:
@@ -274,6 +337,8 @@ class HomeSeerCoverDevice(HomeSeerDimmableDevice):
 class HomeSeerFanDevice(HomeSeerSwitchableDevice):
     """Representation of a HomeSeer device that has a Fan or DimFan control pair."""
 
+    __slots__ = ()
+
     @property
     def speed_percent(self) -> float:
         """Returns a number from 0 to 1 representing the current speed percentage."""
@@ -281,7 +346,7 @@ class HomeSeerFanDevice(HomeSeerSwitchableDevice):
 
     async def speed(self, percent: int) -> None:
         """Set the speed of the device on a scale from 0 to 100."""
-        if percent < 0 or percent > 100:
+        if not 0 <= percent <= 100:
             raise ValueError("Percent must be an integer from 0 to 100")
 
         value = int(self._on_value * (percent / 100))
@@ -290,6 +355,8 @@ class HomeSeerFanDevice(HomeSeerSwitchableDevice):
 class HomeSeerLockableDevice(HomeSeerStatusDevice):
     """Representation of a HomeSeer device that has Lock and Unlock control pairs."""
 
+    __slots__ = ("_lock_value", "_unlock_value")
+
     def __init__(
         self, raw_data: dict, control_data: dict, request: Callable, lock_value: int, unlock_value: int
     ) -> None:
@@ -312,6 +379,16 @@ class HomeSeerLockableDevice(HomeSeerStatusDevice):
 
 class HomeSeerClimateDevice(HomeSeerStatusDevice):
     """Representation of a HomeSeer thermostat."""
+
+    __slots__ = (
+        "_thermo_root",
+        "_mode",
+        "_heater",
+        "_heating_setpoint",
+        "_cooling_setpoint",
+        "_temp",
+    )
+
     def __init__(
         self,
         thermo_root: HomeSeerStatusDevice, 
@@ -333,6 +410,10 @@ class HomeSeerClimateDevice(HomeSeerStatusDevice):
         all_devices = [self._thermo_root, self._mode, self._heater, self._heating_setpoint, self._cooling_setpoint, self._temp]
         return [x for x in all_devices if x is not None]
 
+async def set_many(devices_and_values: Iterable[Tuple[HomeSeerStatusDevice, Any]]) -> None:
+    """Set the value of several devices, sending the requests concurrently."""
+    await asyncio.gather(*(device.set_value(value) for device, value in devices_and_values))
+
 def get_device(
     raw_data: dict, control_data: dict, request: Callable
 ) -> Optional[
@@ -356,10 +437,28 @@ def get_device(
     other = HomeSeerStatusDevice
     """
     item = next((x for x in control_data if x["ref"] == raw_data["ref"]), None)
-    supported_features = get_supported_features(item)
-    return build_device(raw_data, item, request, supported_features)
+    return get_device_for_control_item(raw_data, item, request)
 
-def build_device(raw_data: dict, item: dict, request: Callable, supported_features: int) -> Optional[
+def get_device_for_control_item(
+    raw_data: dict, item: Optional[dict], request: Callable
+) -> HomeSeerStatusDevice:
+    """
+    Same as get_device, for a control data item that has already been matched to raw_data.
+    Use with get_control_data_by_ref when building many devices.
+    """
+    supported_features, pairs = _analyze_control(item)
+    return build_device(raw_data, item, request, supported_features, pairs)
+
+def get_control_data_by_ref(control_data: List[dict]) -> dict:
+    """Index the control data items by device ref, keeping the first item for a duplicated ref."""
+    index = {}
+    for x in control_data:
+        index.setdefault(x["ref"], x)
+    return index
+
+def build_device(
+    raw_data: dict, item: dict, request: Callable, supported_features: int, pairs: Optional[dict] = None
+) -> Optional[
     Union[
         HomeSeerDimmableDevice,
         HomeSeerFanDevice,
@@ -370,97 +469,102 @@ def build_device(raw_data: dict, item: dict, request: Callable, supported_featur
         HomeSeerSetPointDevice
     ]
 ]:
-    if supported_features == SUPPORT_ON | SUPPORT_OFF:
-        return build_switch_device(raw_data, item, request)
-    elif supported_features == SUPPORT_ON | SUPPORT_OFF | SUPPORT_DIM:
-        return build_dimmable_device(raw_data, item, request)
-    elif supported_features == SUPPORT_ON | SUPPORT_OFF | SUPPORT_DIM | SUPPORT_STOP:
-        return build_cover_device(raw_data, item, request)
-    elif supported_features == SUPPORT_ON | SUPPORT_OFF | SUPPORT_STOP:
-        return build_cover_device(raw_data, item, request)
-    elif supported_features == SUPPORT_ON | SUPPORT_OFF | SUPPORT_FAN:
-        return build_fan_device(raw_data, item, request)
-    elif supported_features == SUPPORT_LOCK | SUPPORT_UNLOCK:
-        return build_lockable_device(raw_data, item, request)
-    elif supported_features == SUPPORT_SETPOINT:
-        return build_setpoint_device(raw_data, item, request)
-    else:
-        _LOGGER.debug(
-            f"Failed to automatically detect device Control Pairs for device ref {raw_data['ref']}; "
-            f"creating a status-only device. "
-            f"If this device has controls, open an issue on the libhomeseer repo "
-            f"with the following information to request support for this device: "
-            f"RAW: ({raw_data}) "
-            f"CONTROL: ({item})."
-        )
-        return HomeSeerStatusDevice(raw_data, item, request)
+    builder = _BUILDERS.get(supported_features)
+    if builder is not None:
+        if pairs is None:
+            pairs = _analyze_control(item)[1]
+        return builder(raw_data, item, request, pairs)
+    _LOGGER.debug(
+        "Failed to automatically detect device Control Pairs for device ref %s; "
+        "creating a status-only device. "
+        "If this device has controls, open an issue on the libhomeseer repo "
+        "with the following information to request support for this device: "
+        "RAW: (%s) "
+        "CONTROL: (%s).",
+        raw_data["ref"],
+        raw_data,
+        item,
+    )
+    return HomeSeerStatusDevice(raw_data, item, request)
 
 def get_supported_features(control_item: dict) -> int:
+    return _analyze_control(control_item)[0]
+
+def _analyze_control(control_item: dict) -> Tuple[int, dict]:
+    """
+    Walk the control pairs of control_item once, returning the supported features
+    and the first control pair for each control use, indexed by control use.
+    """
     supported_features = SUPPORT_STATUS
+    pairs = {}
     if control_item is None:
-        return supported_features
+        return supported_features, pairs
     control_pairs = control_item["ControlPairs"]
     if control_pairs is None:
-        return supported_features
+        return supported_features, pairs
     for pair in control_pairs:
         control_use = pair["ControlUse"]
-        if control_use == CONTROL_USE_ON:
-            supported_features |= SUPPORT_ON
-        elif control_use == CONTROL_USE_OFF:
-            supported_features |= SUPPORT_OFF
-        elif control_use == CONTROL_USE_STOP:
-            supported_features |= SUPPORT_STOP
-        elif (control_use == CONTROL_USE_LOCK):
-            supported_features |= SUPPORT_LOCK
-        elif (control_use == CONTROL_USE_UNLOCK):
-            supported_features |= SUPPORT_UNLOCK
-        elif control_use == CONTROL_USE_DIM:
-            supported_features |= SUPPORT_DIM
-        elif control_use == CONTROL_USE_FAN:
-            supported_features |= SUPPORT_FAN
-        elif control_use in [CONTROL_USE_COOL_SETPOINT, CONTROL_USE_HEAT_SETPOINT]:
-            supported_features |= SUPPORT_SETPOINT
-        elif control_use in [CONTROL_USE_THERM_MODE_COOL, CONTROL_USE_THERM_MODE_HEAT, CONTROL_USE_THERM_MODE_OFF]:
-            supported_features |= SUPPORT_THERM_MODES
-    return supported_features
-
-def build_setpoint_device(raw_data: dict, control_item: dict, request: Callable) -> HomeSeerSetPointDevice:
-    pair = get_control_pair_by_control_use(control_item, CONTROL_USE_COOL_SETPOINT)
+        supported_features |= _CONTROL_USE_TO_SUPPORT.get(control_use, SUPPORT_STATUS)
+        pairs.setdefault(control_use, pair)
+    return supported_features, pairs
+
+def build_setpoint_device(raw_data: dict, control_item: dict, request: Callable, pairs: dict) -> HomeSeerSetPointDevice:
+    pair = pairs.get(CONTROL_USE_COOL_SETPOINT)
     if pair is None:
-        pair = get_control_pair_by_control_use(control_item, CONTROL_USE_HEAT_SETPOINT)
+        pair = pairs.get(CONTROL_USE_HEAT_SETPOINT)
     (start, end) = get_range(pair)
     return HomeSeerSetPointDevice(raw_data, control_item, request, start, end)
 
-def build_lockable_device(raw_data: dict, control_item: dict, request: Callable) -> HomeSeerLockableDevice:
-    lock_value = get_control_value_by_control_use(control_item, CONTROL_USE_LOCK)
-    unlock_value = get_control_value_by_control_use(control_item, CONTROL_USE_UNLOCK)
+def build_lockable_device(raw_data: dict, control_item: dict, request: Callable, pairs: dict) -> HomeSeerLockableDevice:
+    lock_value = pairs[CONTROL_USE_LOCK]["ControlValue"]
+    unlock_value = pairs[CONTROL_USE_UNLOCK]["ControlValue"]
     return HomeSeerLockableDevice(raw_data, control_item, request, lock_value, unlock_value)
 
-def build_switch_device(raw_data: dict, control_item: dict, request: Callable) -> HomeSeerSwitchableDevice:
-    on_value = get_control_value_by_control_use(control_item, CONTROL_USE_ON)
-    off_value = get_control_value_by_control_use(control_item, CONTROL_USE_OFF)
+def build_switch_device(raw_data: dict, control_item: dict, request: Callable, pairs: dict) -> HomeSeerSwitchableDevice:
+    on_value = pairs[CONTROL_USE_ON]["ControlValue"]
+    off_value = pairs[CONTROL_USE_OFF]["ControlValue"]
     return HomeSeerSwitchableDevice(raw_data, control_item, request, on_value, off_value)
 
-def build_dimmable_device(raw_data: dict, control_item: dict, request: Callable) -> HomeSeerDimmableDevice:
-    on_value = get_control_value_by_control_use(control_item, CONTROL_USE_ON)
-    off_value = get_control_value_by_control_use(control_item, CONTROL_USE_OFF)
-    (start_value, end_value) = get_range_for(control_item, CONTROL_USE_DIM)
+def build_dimmable_device(raw_data: dict, control_item: dict, request: Callable, pairs: dict) -> HomeSeerDimmableDevice:
+    on_value = pairs[CONTROL_USE_ON]["ControlValue"]
+    off_value = pairs[CONTROL_USE_OFF]["ControlValue"]
+    (start_value, end_value) = get_range(pairs[CONTROL_USE_DIM])
     return HomeSeerDimmableDevice(raw_data, control_item, request, on_value, off_value, start_value, end_value)
 
-def build_cover_device(raw_data: dict, control_item: dict, request: Callable) -> HomeSeerCoverDevice:
-    on_value = get_control_value_by_control_use(control_item, CONTROL_USE_ON)
-    off_value = get_control_value_by_control_use(control_item, CONTROL_USE_OFF)
-    stop_value = get_control_value_by_control_use(control_item, CONTROL_USE_STOP)
-    (start_value, end_value) = get_range_for(control_item, CONTROL_USE_DIM)
+def build_cover_device(raw_data: dict, control_item: dict, request: Callable, pairs: dict) -> HomeSeerCoverDevice:
+    on_value = pairs[CONTROL_USE_ON]["ControlValue"]
+    off_value = pairs[CONTROL_USE_OFF]["ControlValue"]
+    stop_value = pairs[CONTROL_USE_STOP]["ControlValue"]
+    (start_value, end_value) = get_range(pairs[CONTROL_USE_DIM])
     return HomeSeerCoverDevice(raw_data, control_item, request, on_value, off_value, stop_value, start_value, end_value)
 
-def build_fan_device(raw_data: dict, control_item: dict, request: Callable) -> HomeSeerFanDevice:
-    on_value = get_control_value_by_control_use(control_item, CONTROL_USE_ON)
-    off_value = get_control_value_by_control_use(control_item, CONTROL_USE_OFF)
+def build_cover_no_dim_device(raw_data: dict, control_item: dict, request: Callable, pairs: dict) -> HomeSeerCoverDevice:
+    on_value = pairs[CONTROL_USE_ON]["ControlValue"]
+    off_value = pairs[CONTROL_USE_OFF]["ControlValue"]
+    stop_value = pairs[CONTROL_USE_STOP]["ControlValue"]
+    return HomeSeerCoverDevice(raw_data, control_item, request, on_value, off_value, stop_value)
+
+def build_fan_device(raw_data: dict, control_item: dict, request: Callable, pairs: dict) -> HomeSeerFanDevice:
+    on_value = pairs[CONTROL_USE_ON]["ControlValue"]
+    off_value = pairs[CONTROL_USE_OFF]["ControlValue"]
     return HomeSeerFanDevice(raw_data, control_item, request, on_value, off_value)
 
+# Each builder is only selected for the exact feature mask below, so the control
+# pairs that mask requires are known to be present in pairs.
+_BUILDERS = {
+    _MASK_SWITCH: build_switch_device,
+    _MASK_DIM: build_dimmable_device,
+    _MASK_COVER: build_cover_device,
+    _MASK_COVER_NODIM: build_cover_no_dim_device,
+    _MASK_FAN: build_fan_device,
+    _MASK_LOCK: build_lockable_device,
+    SUPPORT_SETPOINT: build_setpoint_device,
+}
+
 def get_control_value_by_control_use(item: dict, control_use:int) -> Union[int,float, str, None]:
-    control_pair = get_control_pair_by_control_use(item, control_use)
+    return get_control_value(get_control_pair_by_control_use(item, control_use))
+
+def get_control_value(control_pair: Optional[dict]) -> Union[int,float, str, None]:
     if control_pair is not None:
         return control_pair["ControlValue"]
     return None
@@ -469,6 +573,8 @@ def get_control_pair_by_control_use(item: dict, control_use:int) -> Union[dict,
     if item is None:
         return None
     control_pairs = item["ControlPairs"]
+    if control_pairs is None:
+        return None
     control_pair = next((x for x in control_pairs if x["ControlUse"] == control_use), None)
     return control_pair
 
@@ -484,9 +590,14 @@ def get_range(control_pair:dict) -> Union[Tuple[float, float], None]:
     end = the_range["RangeEnd"]
     return (start, end)
    
-def get_thermostat(thermostat: HomeSeerStatusDevice, devices: List[HomeSeerStatusDevice]) -> HomeSeerClimateDevice:
-    children_ids = thermostat._raw_data["associated_devices"]
-    children = [dev for dev in devices if dev.ref in children_ids]
+def build_thermostat_index(devices: List[HomeSeerStatusDevice]) -> Dict[int, Tuple[int, HomeSeerStatusDevice]]:
+    """Index devices by ref, with their position in devices, for resolving the children of thermostats with get_thermostat."""
+    return {dev.ref: (position, dev) for position, dev in enumerate(devices)}
+
+def get_thermostat(thermostat: HomeSeerStatusDevice, index: Dict[int, Tuple[int, HomeSeerStatusDevice]]) -> HomeSeerClimateDevice:
+    # Sort by position so children are searched in device-list order, as when scanning the list.
+    children_ids = set(thermostat._raw_data["associated_devices"])
+    children = [dev for _, dev in sorted(index[ref] for ref in children_ids if ref in index)]
 
     mode = get_device_by_type(children, "Z-Wave Mode")
     heater = get_device_by_type(children, "Z-Wave Switch")
@@ -499,4 +610,4 @@ def get_thermostat(thermostat: HomeSeerStatusDevice, devices: List[HomeSeerStatu
     return HomeSeerClimateDevice(thermostat, mode, heater, heating_setpoint, cooling_setpoint, floor_temp)
 
 def get_device_by_type(devices: List[HomeSeerStatusDevice], type: str, name:str = "") -> Union[HomeSeerStatusDevice, None]:
-    return next((x for x in devices if x.device_type_string == type and (name == "" or name in x.name)), None)
\ No newline at end of file
+    return next((x for x in devices if x.device_type_string == type and (name == "" or name in x.name)), None)
@@ -5,6 +5,24 @@ from datetime import datetime, timezone
 from string import digits
 from typing import Optional
 
+__all__ = [
+    "HS_UNIT_A",
+    "HS_UNIT_AMPERES",
+    "HS_UNIT_CELSIUS",
+    "HS_UNIT_FAHRENHEIT",
+    "HS_UNIT_KW",
+    "HS_UNIT_KWH",
+    "HS_UNIT_LUX",
+    "HS_UNIT_PERCENTAGE",
+    "HS_UNIT_V",
+    "HS_UNIT_VOLTS",
+    "HS_UNIT_W",
+    "HS_UNIT_WATTS",
+    "HS_NULL_DATE",
+    "get_datetime_from_last_change",
+    "get_uom_from_status",
+]
+
 HS_UNIT_A = "A"
 HS_UNIT_AMPERES = "Amperes"
 HS_UNIT_CELSIUS = "C"
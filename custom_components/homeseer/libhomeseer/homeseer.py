@@ -16,7 +16,9 @@ from .const import (
 from .devices import (
     HomeSeerClimateDevice,
     HomeSeerStatusDevice,
-    get_device,
+    build_thermostat_index,
+    get_control_data_by_ref,
+    get_device_for_control_item,
     get_thermostat
 )
 from .events import HomeSeerEvent
@@ -108,25 +110,28 @@ class HomeSeer:
                 auth=self._auth,
             ) as result:
                 result.raise_for_status()
-                _LOGGER.debug(
-                    f"HomeSeer request response from {self._host}: {await result.text()}"
-                )
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "HomeSeer request response from %s: %s",
+                        self._host,
+                        await result.text(),
+                    )
                 return await result.json()
 
         except ContentTypeError as cte:
             _LOGGER.debug(
-                f"HomeSeer returned non-JSON response from {self._host}: {cte}"
+                "HomeSeer returned non-JSON response from %s: %s", self._host, cte
             )
 
         except TimeoutError:
-            _LOGGER.error(f"Timeout while requesting HomeSeer data from {self._host}")
+            _LOGGER.error("Timeout while requesting HomeSeer data from %s", self._host)
 
         except Exception as ex:
-            _LOGGER.error(f"HomeSeer HTTP Request error from {self._host}: {ex}")
+            _LOGGER.error("HomeSeer HTTP Request error from %s: %s", self._host, ex)
 
     async def _get_devices(self) -> None:
         """Populate supported devices from HomeSeer API."""
-        _LOGGER.debug(f"Requesting HomeSeer devices from {self._host}")
+        _LOGGER.debug("Requesting HomeSeer devices from %s", self._host)
         try:
             params = {"request": "getstatus"}
             result = await self._request("get", params=params)
@@ -136,20 +141,22 @@ class HomeSeer:
             params = {"request": "getcontrol"}
             result = await self._request("get", params=params)
 
-            control_data = result["Devices"]
+            control_data = get_control_data_by_ref(result["Devices"])
 
             for device in all_devices:
                 try:
-                    dev = get_device(device, control_data, self._request)
+                    dev = get_device_for_control_item(
+                        device, control_data.get(device["ref"]), self._request
+                    )
                     if dev is not None:
                         self._devices[dev.ref] = dev
                 except Exception as e:
-                    _LOGGER.error(f"Error retrieving HomeSeer devices from {self._host}: {e}")
+                    _LOGGER.error("Error retrieving HomeSeer devices from %s: %s", self._host, e)
 
             self.find_thermostats()
 
         except Exception as e:
-            _LOGGER.error(f"Error retrieving HomeSeer devices from {self._host}: {e}")
+            _LOGGER.error("Error retrieving HomeSeer devices from %s: %s", self._host, e)
         
 
     def find_thermostats(self) -> None:
@@ -157,28 +164,29 @@ class HomeSeer:
         devices = list(self._devices.values())
         status_devices = [dev for dev in devices if isinstance(dev, HomeSeerStatusDevice)]
         thermostat_roots = [dev for dev in status_devices if dev.device_type_string == "Z-Wave Thermostat Root Device"]
+        index = build_thermostat_index(status_devices)
         for thermostat in thermostat_roots:
             try:
-                dev = get_thermostat(thermostat, status_devices)
+                dev = get_thermostat(thermostat, index)
                 if dev is not None:
                     self.remove_thermostat_devices(dev)
                     self._devices[dev.ref] = dev
-                    _LOGGER.info(f"Created HomeSeerClimateDevice from {dev.ref}")
+                    _LOGGER.info("Created HomeSeerClimateDevice from %s", dev.ref)
             except Exception as e:
-                _LOGGER.error(f"Error creating thermostat {thermostat}: {e}")
+                _LOGGER.error("Error creating thermostat %s: %s", thermostat, e)
 
     def remove_thermostat_devices(self, thermostat: HomeSeerClimateDevice) -> None:
         for dev in thermostat.get_devices():
             try:
                 self._devices.pop(dev.ref)
             except Exception:
-                _LOGGER.warning(f"No able to pop")
+                _LOGGER.warning("No able to pop")
         
 
 
     async def _get_events(self) -> None:
         """Populate supported events from HomeSeer API."""
-        _LOGGER.debug(f"Requesting HomeSeer events from {self._host}")
+        _LOGGER.debug("Requesting HomeSeer events from %s", self._host)
         try:
             params = {"request": "getevents"}
             result = await self._request("get", params=params)
@@ -190,7 +198,7 @@ class HomeSeer:
                 self._events.append(ev)
 
         except TypeError:
-            _LOGGER.error(f"Error retrieving HomeSeer events from {self._host}")
+            _LOGGER.error("Error retrieving HomeSeer events from %s", self._host)
 
     async def _message_callback(self, device_ref: str) -> None:
         """Called by the ASCII listener when a Device Change message is received."""
@@ -198,13 +206,15 @@ class HomeSeer:
             entity = self._entites[int(device_ref)]
         except KeyError:
             _LOGGER.debug(
-                f"Device Change message received for unsupported or uninitialized device "
-                f"from {self._host}: device ref {device_ref}"
+                "Device Change message received for unsupported or uninitialized device "
+                "from %s: device ref %s",
+                self._host,
+                device_ref,
             )
             return
 
         params = {"request": "getstatus", "ref": entity.ref}
-        _LOGGER.debug(f"Requesting updated data for device ref {device_ref}")
+        _LOGGER.debug("Requesting updated data for device ref %s", device_ref)
         try:
             result = await self._request("get", params=params)
             for raw_dev in result["Devices"]:
@@ -212,13 +222,16 @@ class HomeSeer:
                     entity.update_data(raw_dev)
         except Exception as ex:
             _LOGGER.error(
-                f"Error retrieving updated data for device ref {entity.ref} from {self._host}: {ex}"
+                "Error retrieving updated data for device ref %s from %s: %s",
+                entity.ref,
+                self._host,
+                ex,
             )
 
     async def _connect_callback(self) -> None:
         """Called by the ASCII listener after an ASCII connection is established."""
         _LOGGER.debug(
-            f"Refreshing devices for {self._host} and setting availability to True"
+            "Refreshing devices for %s and setting availability to True", self._host
         )
         self._available = True
 
@@ -228,22 +241,33 @@ class HomeSeer:
             homeseer_devices = result["Devices"]
 
         except TypeError:
-            _LOGGER.error(f"Error refreshing HomeSeer data from {self._host}")
+            _LOGGER.error("Error refreshing HomeSeer data from %s", self._host)
             return
 
+        # Thermostat child devices are only tracked in _entites; refresh them first so
+        # the combined climate devices render current child values when they update below.
+        for raw_device in homeseer_devices:
+            ref = int(raw_device["ref"])
+            entity = self._entites.get(ref)
+            if entity is not None and self._devices.get(ref) is not entity:
+                entity.update_data(new_data=raw_device, connection_flag=True)
+
         for raw_device in homeseer_devices:
             try:
                 device = self.devices[int(raw_device["ref"])]
                 device.update_data(new_data=raw_device, connection_flag=True)
             except KeyError:
                 _LOGGER.debug(
-                    f"HomeSeer refresh data retrieved for unsupported or uninitialized device from {self._host}: "
-                    f"device ref {raw_device['ref']} ({raw_device})"
+                    "HomeSeer refresh data retrieved for unsupported or uninitialized device from %s: "
+                    "device ref %s (%s)",
+                    self._host,
+                    raw_device["ref"],
+                    raw_device,
                 )
 
     async def _disconnect_callback(self) -> None:
         """Called by the ASCII listener after an ASCII connection is disconnected."""
-        _LOGGER.debug(f"Setting availability for {self._host} to False")
+        _LOGGER.debug("Setting availability for %s to False", self._host)
         self._available = False
 
         for device in self.devices.values():
@@ -100,7 +100,7 @@ class Listener:
             while True:
                 msg = await self._reader.readline()
                 _LOGGER.debug(
-                    f"ASCII message received from {self._host}:{self._port}: {msg}"
+                    "ASCII message received from %s:%s: %s", self._host, self._port, msg
                 )
                 if msg == b"":
                     raise HomeSeerASCIIConnectionError
@@ -131,7 +131,10 @@ class Listener:
                 await self._async_message_callback(msg[1])
         else:
             _LOGGER.debug(
-                f"Unhandled ASCII message type received from {self._host}:{self._port}: {msg[0].strip()}"
+                "Unhandled ASCII message type received from %s:%s: %s",
+                self._host,
+                self._port,
+                msg[0].strip(),
             )
 
     async def _ping(self):
@@ -23,7 +23,9 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         entity = HomeSeerLight(device, bridge)
         light_entities.append(entity)
         _LOGGER.info(
-            f"Added HomeSeer light-type device: {entity.name} ({entity.device_state_attributes})"
+            "Added HomeSeer light-type device: %s (%s)",
+            entity.name,
+            entity.device_state_attributes,
         )
 
     if light_entities:
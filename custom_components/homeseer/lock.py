@@ -19,7 +19,9 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         entity = HomeSeerLock(device, bridge)
         lock_entities.append(entity)
         _LOGGER.info(
-            f"Added HomeSeer lock-type device: {entity.name} ({entity.device_state_attributes})"
+            "Added HomeSeer lock-type device: %s (%s)",
+            entity.name,
+            entity.device_state_attributes,
         )
 
     if lock_entities:
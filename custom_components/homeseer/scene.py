@@ -16,7 +16,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     for event in bridge.devices["scene"]:
         entity = HomeSeerScene(event)
         scenes.append(entity)
-        _LOGGER.info(f"Added HomeSeer event: {entity.name}")
+        _LOGGER.info("Added HomeSeer event: %s", entity.name)
 
     if scenes:
         async_add_entities(scenes)
@@ -69,7 +69,9 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         entity = get_sensor_entity(device, bridge)
         sensor_entities.append(entity)
         _LOGGER.info(
-            f"Added HomeSeer sensor-type device: {entity.name} ({entity.device_state_attributes})"
+            "Added HomeSeer sensor-type device: %s (%s)",
+            entity.name,
+            entity.device_state_attributes,
         )
 
     if sensor_entities:
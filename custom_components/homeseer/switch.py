@@ -19,7 +19,9 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         entity = HomeSeerSwitch(device, bridge)
         switch_entities.append(entity)
         _LOGGER.info(
-            f"Added HomeSeer switch-type device: {entity.name} ({entity.device_state_attributes})"
+            "Added HomeSeer switch-type device: %s (%s)",
+            entity.name,
+            entity.device_state_attributes,
         )
 
     if switch_entities:
@@ -1,9 +1,14 @@
 import aiohttp
 import asyncio
 import logging
-import libhomeseer
+import os
 import sys
 
+# libhomeseer lives inside the integration package; make it importable when running this script from examples/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "custom_components", "homeseer"))
+
+import libhomeseer
+
 async def main():
 
     # if len(sys.argv) < 2:
@@ -58,7 +63,8 @@ async def main():
     print("Starting HomeSeer ASCII listener...")
     await homeseer.start_listener()
 
-logging.basicConfig(level=logging.INFO)
-loop = asyncio.get_event_loop()
-loop.create_task(main())
-loop.run_forever()
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    loop = asyncio.get_event_loop()
+    loop.create_task(main())
+    loop.run_forever()